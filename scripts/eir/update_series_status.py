@@ -36,6 +36,11 @@ from typing import Any, Dict, List
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 LEDGER_PATH = REPO_ROOT / "docs" / "source" / "eir" / "eir_series_status.yaml"
 
@@ -49,11 +54,6 @@ from semantiva.pipeline.graph_builder import (
 )  # noqa: E402
 
 
-def sha256_file(path: Path) -> str:
-    """Compute the hex sha256 digest for a file."""
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
 def load_ledger(path: Path) -> Dict[str, Any]:
     """Load and minimally validate the series ledger YAML.
 
@@ -102,11 +102,16 @@ def update_float_suite(data: Dict[str, Any]) -> List[str]:
                 "each float reference entry must be a mapping with 'id' and 'yaml_path'"
             )
         yaml_path = REPO_ROOT / str(entry["yaml_path"])
-        if not yaml_path.exists():
-            raise FileNotFoundError(f"reference yaml_path not found: {yaml_path}")
-
-        entry["yaml_sha256"] = sha256_file(yaml_path)
-        canonical, _ = build_canonical_spec(str(yaml_path))
+        try:
+            raw = yaml_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"reference yaml_path not found: {yaml_path}"
+            ) from None
+
+        entry["yaml_sha256"] = hashlib.sha256(raw).hexdigest()
+        # Canonicalize the already-read bytes instead of re-reading the path.
+        canonical, _ = build_canonical_spec(yaml.load(raw, Loader=_YamlLoader))
         entry["pipeline_id"] = compute_pipeline_id(canonical)
         updated.append(str(entry["id"]))
 
@@ -21,6 +21,11 @@ from typing import Any, Dict, Iterable, List, Mapping, cast
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from semantiva.registry import RegistryProfile, apply_profile, load_extensions
 
 from .schema import (
@@ -245,8 +250,8 @@ def load_pipeline_from_yaml(yaml_file: str) -> PipelineConfiguration:
     """Load a Semantiva pipeline configuration from a YAML file."""
 
     path = Path(yaml_file).expanduser().resolve()
-    with path.open("r", encoding="utf-8") as file:
-        pipeline_config = yaml.safe_load(file)
+    with path.open("rb") as file:
+        pipeline_config = yaml.load(file, Loader=_YamlLoader)
 
     return parse_pipeline_config(
         pipeline_config or {},
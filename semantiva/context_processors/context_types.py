@@ -541,3 +541,14 @@ class ContextCollectionType(ContextType):
             "global": dict(self._context_container),
             "locals": [ctx.to_dict() for ctx in self._context_list],
         }
+
+
+def _has_context_key(context: ContextType, key: str) -> bool:
+    """Return True if ``key`` resolves in ``context``.
+
+    Plain contexts answer with a dict lookup; collections go through
+    :meth:`ContextCollectionType.keys` so their merge and conflict rules apply.
+    """
+    if isinstance(context, ContextCollectionType):
+        return key in context.keys()
+    return key in context._context_container
@@ -16,7 +16,7 @@
 
 import re
 from string import Formatter
-from typing import List
+from typing import List, Optional, Tuple
 
 
 from semantiva.context_processors.context_processors import (
@@ -188,11 +188,21 @@ def create_delete_operation(key: str) -> type[ContextProcessor]:
     return _context_deleter_factory(key)
 
 
+def _split_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a validated template into ``(literal, field_name)`` parts once."""
+
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    )
+
+
 def _context_template_factory(template: str, output_key: str) -> type[ContextProcessor]:
     """Create a ContextProcessor subclass that renders templates from context keys."""
 
     _ensure_valid_key(output_key)
     required_keys = _extract_strict_placeholders(template)
+    parts = _split_template(template)
     class_suffix_out = _sanitize_identifier(output_key)
 
     def _process_logic(self, **kwargs):
@@ -202,8 +212,12 @@ def _context_template_factory(template: str, output_key: str) -> type[ContextPro
                 "Context template missing required keys: " + ", ".join(sorted(missing))
             )
 
-        values = {name: str(kwargs[name]) for name in required_keys}
-        rendered = template.format(**values)
+        pieces: List[str] = []
+        for literal, field_name in parts:
+            pieces.append(literal)
+            if field_name is not None:
+                pieces.append(str(kwargs[field_name]))
+        rendered = "".join(pieces)
         self._notify_context_update(output_key, rendered)
         self.logger.debug(
             "Template wrote %s=%r using keys %s",
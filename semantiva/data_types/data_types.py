@@ -23,6 +23,11 @@ from semantiva.core.semantiva_component import _SemantivaComponent
 from semantiva.logger import Logger
 
 T = TypeVar("T")
+_D = TypeVar("_D", bound="BaseDataType[Any]")
+
+
+def _trusted(data: Any) -> bool:
+    return True
 
 
 class BaseDataType(_SemantivaComponent, Generic[T]):
@@ -50,6 +55,23 @@ class BaseDataType(_SemantivaComponent, Generic[T]):
         self.validate(data)
         self._data = data
 
+    @classmethod
+    def _from_validated(
+        cls: Type[_D], data: Any, logger: Optional[Logger] = None
+    ) -> _D:
+        """Build an instance from ``data`` the caller has already validated.
+
+        Runs :meth:`BaseDataType.__init__` so base setup is shared, with
+        ``validate`` short-circuited for this one construction.
+        """
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "validate", _trusted)
+        try:
+            BaseDataType.__init__(obj, data, logger)
+        finally:
+            delattr(obj, "validate")
+        return obj
+
     @property
     def data(self) -> T:
         """
@@ -293,9 +315,9 @@ class MultiChannelDataType(BaseDataType[dict[str, "BaseDataType[Any]"]]):
             raise TypeError("channel must be str")
         if not isinstance(value, BaseDataType):
             raise TypeError("value must be a BaseDataType instance")
-        updated = dict(self._data)
+        updated = self._data.copy()
         updated[channel] = value
-        return MultiChannelDataType(updated)
+        return MultiChannelDataType._from_validated(updated)
 
 
 class LaneBundleDataType(BaseDataType[dict[str, "BaseDataType[Any]"]]):
@@ -327,6 +349,6 @@ class LaneBundleDataType(BaseDataType[dict[str, "BaseDataType[Any]"]]):
             raise TypeError("lane must be a non-empty str")
         if not isinstance(value, BaseDataType):
             raise TypeError("value must be a BaseDataType instance")
-        updated = dict(self._data)
+        updated = self._data.copy()
         updated[lane] = value
-        return LaneBundleDataType(updated)
+        return LaneBundleDataType._from_validated(updated)
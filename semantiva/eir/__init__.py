@@ -20,4 +20,4 @@ Phase 2 note:
 
 from .slot_inference import SlotInference, infer_data_slots  # noqa: F401
 from .compiler import compile_eir_v1  # noqa: F401
-from .validation import validate_eir_v1  # noqa: F401
+from .validation import is_eir_v1_valid, validate_eir_v1  # noqa: F401
@@ -24,15 +24,28 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from semantiva.data_types import BaseDataType, LaneBundleDataType, MultiChannelDataType
 from semantiva.eir.slot_inference import infer_data_slots
-from semantiva.pipeline.graph_builder import build_canonical_spec, compute_pipeline_id
+from semantiva.pipeline.graph_builder import (
+    _processor_ref,
+    build_canonical_spec,
+    compute_pipeline_id,
+)
 from semantiva.registry import load_extensions, resolve_symbol
 from semantiva.registry.descriptors import descriptor_to_json
 
+# json.dumps() builds a fresh JSONEncoder whenever non-default options are
+# passed; reuse one configured encoder for the identity hashing hot path.
+_STABLE_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
 
 def _stable_dumps(obj: Any) -> str:
-    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return _STABLE_ENCODER.encode(obj)
 
 
 def _sha256_text(s: str) -> str:
@@ -53,10 +66,22 @@ def _fingerprint_source(pipeline_or_spec: Any) -> Tuple[str, str]:
     if hasattr(pipeline_or_spec, "pipeline_configuration"):
         return ("pipeline_object", "pipeline_object")
     if isinstance(pipeline_or_spec, (list, tuple)):
-        return ("node_list", _sha256_text(_stable_dumps(list(pipeline_or_spec))))
+        nodes = list(pipeline_or_spec)
+        if not all(
+            isinstance(n, dict) and isinstance(n.get("processor"), str) for n in nodes
+        ):
+            nodes = [_with_processor_ref(n) for n in nodes]
+        return ("node_list", _sha256_text(_stable_dumps(nodes)))
     return ("unknown", "unknown")
 
 
+def _with_processor_ref(node: Any) -> Any:
+    """Return ``node`` with a class ``processor`` replaced by its dotted path."""
+    if isinstance(node, dict) and isinstance(node.get("processor"), type):
+        return {**node, "processor": _processor_ref(node["processor"])}
+    return node
+
+
 def _extract_extensions(doc: Any) -> List[str]:
     if not isinstance(doc, dict):
         return []
@@ -75,23 +100,32 @@ def _extract_extensions(doc: Any) -> List[str]:
     return []
 
 
-def _maybe_load_extensions(pipeline_or_spec: Any) -> None:
+def _load_yaml_document(pipeline_or_spec: Any) -> Any:
     """
-    Best-effort: when compiling from YAML, load declared extensions so processor
-    symbols can be resolved deterministically (entry points supported).
+    Best-effort: read and parse a YAML path or YAML string exactly once.
+    Never raises; non-YAML inputs and unreadable documents yield None.
     """
     if not isinstance(pipeline_or_spec, str):
-        return
+        return None
     p = Path(pipeline_or_spec)
     try:
         raw = p.read_text(encoding="utf-8") if p.exists() else pipeline_or_spec
-        doc = yaml.safe_load(raw)
+        return yaml.load(raw, Loader=_YamlLoader)
     except Exception:
-        return
+        return None
+
+
+def _is_pipeline_document(doc: Any) -> bool:
+    return isinstance(doc, list) or (isinstance(doc, dict) and "pipeline" in doc)
+
 
-    exts = _extract_extensions(doc)
-    if exts:
-        load_extensions(exts)
+def _maybe_load_extensions(extensions: List[str]) -> None:
+    """
+    Best-effort: when compiling from YAML, load declared extensions so processor
+    symbols can be resolved deterministically (entry points supported).
+    """
+    if extensions:
+        load_extensions(extensions)
 
 
 def _try_import_dotted(symbol: str) -> Optional[type]:
@@ -118,7 +152,7 @@ def _resolve_processor(proc_spec: Any) -> Tuple[Optional[type], str]:
     Never raises.
     """
     if isinstance(proc_spec, type):
-        return proc_spec, f"{proc_spec.__module__}.{proc_spec.__qualname__}"
+        return proc_spec, _processor_ref(proc_spec)
     ref = str(proc_spec or "")
     if not ref:
         return None, ""
@@ -239,18 +273,35 @@ def compile_eir_v1(pipeline_or_spec: Any) -> Dict[str, Any]:
 
     No runtime execution semantics change.
     """
-    _maybe_load_extensions(pipeline_or_spec)
-
-    canonical_graph, resolved_nodes = build_canonical_spec(pipeline_or_spec)
+    doc = _load_yaml_document(pipeline_or_spec)
+    runtime_extensions = _extract_extensions(doc)
+    _maybe_load_extensions(runtime_extensions)
+
+    # Canonicalize from the already-parsed document instead of re-reading the
+    # YAML; anything that is not a pipeline document keeps the original input
+    # so build_canonical_spec reports the same errors as before.
+    spec_source = doc if _is_pipeline_document(doc) else pipeline_or_spec
+    canonical_graph, resolved_nodes = build_canonical_spec(spec_source)
     pipeline_id = compute_pipeline_id(canonical_graph)
 
     observed_modules: set[str] = {"classic_scalar", "compile_semantics_v1"}
 
     node_io: Dict[str, Dict[str, Any]] = {}
     node_slots: Dict[str, Dict[str, Any]] = {}
+    param_objects: Dict[str, Any] = {}
+    node_order: List[str] = []
+    node_runtime: dict[str, dict[str, Any]] = {}
 
+    # Single pass over the nodes: semantics, parameters and runtime metadata.
     for node_canon, node_resolved in zip(canonical_graph["nodes"], resolved_nodes):
         node_uuid = str(node_canon["node_uuid"])
+        node_order.append(node_uuid)
+        params = node_resolved.get("parameters", {}) or {}
+        param_objects[f"params:{node_uuid}"] = descriptor_to_json(params)
+        ck = node_resolved.get("context_key")
+        if isinstance(ck, str) and ck.strip():
+            node_runtime.setdefault(node_uuid, {})["context_key"] = ck
+
         proc_spec = (
             node_resolved.get("processor") or node_canon.get("processor_ref") or ""
         )
@@ -295,14 +346,6 @@ def compile_eir_v1(pipeline_or_spec: Any) -> Dict[str, Any]:
             },
         }
 
-    param_objects: Dict[str, Any] = {}
-    node_order: List[str] = []
-    for node_canon, node_resolved in zip(canonical_graph["nodes"], resolved_nodes):
-        node_uuid = str(node_canon["node_uuid"])
-        node_order.append(node_uuid)
-        params = node_resolved.get("parameters", {}) or {}
-        param_objects[f"params:{node_uuid}"] = descriptor_to_json(params)
-
     plan = {
         "plan_version": 1,
         "segments": [{"kind": "classic_linear", "node_order": node_order}],
@@ -361,26 +404,6 @@ def compile_eir_v1(pipeline_or_spec: Any) -> Dict[str, Any]:
         "lineage": {},
     }
 
-    runtime_extensions: list[str] = []
-    if isinstance(pipeline_or_spec, str):
-        try:
-            raw = (
-                Path(pipeline_or_spec).read_text(encoding="utf-8")
-                if Path(pipeline_or_spec).exists()
-                else pipeline_or_spec
-            )
-            doc = yaml.safe_load(raw)
-            runtime_extensions = _extract_extensions(doc)
-        except Exception:
-            runtime_extensions = []
-
-    node_runtime: dict[str, dict[str, Any]] = {}
-    for node_canon, node_resolved in zip(canonical_graph["nodes"], resolved_nodes):
-        node_uuid = str(node_canon["node_uuid"])
-        ck = node_resolved.get("context_key")
-        if isinstance(ck, str) and ck.strip():
-            node_runtime.setdefault(node_uuid, {})["context_key"] = ck
-
     eir["source"]["extensions"] = runtime_extensions
     if node_runtime:
         eir["source"]["node_runtime"] = node_runtime
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from importlib import resources
 from typing import Any, Dict
@@ -36,6 +37,18 @@ def load_eir_v1_schema() -> Dict[str, Any]:
     return json.loads(schema_path.read_text(encoding="utf-8"))
 
 
+@functools.lru_cache(maxsize=1)
+def _eir_v1_validator() -> jsonschema.Draft202012Validator:
+    """Return the Draft 2020-12 validator for the packaged EIR v1 schema.
+
+    The schema is loaded and checked against its metaschema once per process;
+    subsequent calls reuse the compiled validator.
+    """
+    schema = load_eir_v1_schema()
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
+
+
 def validate_eir_v1(eir: Dict[str, Any]) -> None:
     """
     Validate an EIR v1 document against the packaged EIR v1 JSON schema.
@@ -49,5 +62,20 @@ def validate_eir_v1(eir: Dict[str, Any]) -> None:
         jsonschema.ValidationError: if the document is not schema-conformant.
         jsonschema.SchemaError: if the packaged schema is invalid.
     """
-    schema = load_eir_v1_schema()
-    jsonschema.Draft202012Validator(schema).validate(eir)
+    _eir_v1_validator().validate(eir)
+
+
+def is_eir_v1_valid(eir: Dict[str, Any]) -> bool:
+    """
+    Return whether an EIR v1 document conforms to the packaged EIR v1 schema.
+
+    Boolean counterpart of :func:`validate_eir_v1` for callers that only need
+    a yes/no answer; no ``ValidationError`` is constructed for invalid input.
+
+    Args:
+        eir: EIR document (dict) to check.
+
+    Raises:
+        jsonschema.SchemaError: if the packaged schema is invalid.
+    """
+    return _eir_v1_validator().is_valid(eir)
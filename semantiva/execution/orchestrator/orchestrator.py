@@ -21,6 +21,7 @@ The canonical documentation for the orchestrator lifecycle and SER integration l
 
 from __future__ import annotations
 
+import json
 import time
 import uuid
 from abc import ABC, abstractmethod
@@ -81,6 +82,36 @@ def _const_supplier(value: T) -> Callable[[], T]:
     return _supplier
 
 
+_JSON_LEAF_TYPES = (str, int, float, bool, type(None))
+
+
+def _clone_json_key(key: Any) -> str:
+    if type(key) is str:
+        return key
+    if isinstance(key, _JSON_LEAF_TYPES):
+        # Same coercion json.dumps applies to non-str keys (1 -> "1", None -> "null").
+        return json.loads(json.dumps({key: None})).popitem()[0]
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
+def _clone_json(obj: Any) -> Any:
+    """Equivalent of ``json.loads(json.dumps(obj))`` without serializing plain data.
+
+    Dicts, lists/tuples and exact JSON scalars are copied directly; any other
+    value goes through a real JSON round-trip, so non-JSON objects still raise
+    ``TypeError``.
+    """
+    if type(obj) in _JSON_LEAF_TYPES:
+        return obj
+    if isinstance(obj, dict):
+        return {_clone_json_key(k): _clone_json(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_clone_json(v) for v in obj]
+    return json.loads(json.dumps(obj))
+
+
 class SemantivaOrchestrator(ABC):
     """Template-method orchestrator that centralises SER composition.
 
@@ -904,10 +935,8 @@ class SemantivaOrchestrator(ABC):
         # Build preprocessing_provenance with raw expressions
         preprocessing_data = {}
         if isinstance(pre, dict):
-            import json
-
             # Deep copy the sanitized metadata
-            prov = json.loads(json.dumps(pre))
+            prov = _clone_json(pre)
             # Add raw expressions from _expr_src
             raw_exprs = getattr(proc_cls, "_expr_src", {})
             if raw_exprs:
@@ -24,58 +24,67 @@ from typing import Any, Dict, Optional, Tuple, List, Set
 import inspect
 
 from semantiva.data_processors.data_processors import ParameterInfo, _NO_DEFAULT
-from semantiva.context_processors.context_types import ContextType
+from semantiva.context_processors.context_types import ContextType, _has_context_key
 
 
 _RESERVED_NAMES: Set[str] = {"context"}
 
 
-def _allowed_param_names(processor_cls) -> Set[str]:
-    """Introspect `_process_logic` and return allowed parameter names.
+# Factory-generated classes that legitimately need dynamic parameters.
+_ALLOWED_KWARGS_PATTERNS: Tuple[str, ...] = (
+    "ParametricSweep",  # Parametric sweep factory
+    "Rename_",  # ContextProcessor rename factory
+    "Delete_",  # ContextProcessor delete factory
+    "Template_",  # ContextProcessor template factory
+)
 
-    Allowed names exclude framework-reserved names.
-    Processors with **kwargs are rejected for provenance reliability,
-    except for certain factory-generated classes that need dynamic parameters.
+
+def _signature_parts(processor_cls) -> Tuple[Set[str], bool]:
+    """Return ``(declared names, accepts **kwargs)`` for ``_process_logic``.
+
+    The signature is built once and both parts are derived from it.
     """
 
     fn = getattr(processor_cls, "_process_logic", None)
     if fn is None:
-        return set()
-    sig = inspect.signature(fn)
+        return set(), False
     names: Set[str] = set()
-
-    # Check for **kwargs
-    has_kwargs = any(
-        p.kind is inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
-    )
-
-    if has_kwargs:
-        # Allow **kwargs for specific factory-generated classes that need dynamic parameters
-        class_name = processor_cls.__name__
-        allowed_kwargs_patterns = [
-            "ParametricSweep",  # Parametric sweep factory
-            "Rename_",  # ContextProcessor rename factory
-            "Delete_",  # ContextProcessor delete factory
-            "Template_",  # ContextProcessor template factory
-        ]
-
-        is_allowed_dynamic = any(
-            pattern in class_name for pattern in allowed_kwargs_patterns
-        )
-
-        if not is_allowed_dynamic:
-            raise ValueError(
-                f"Processor {processor_cls.__name__} uses **kwargs which is incompatible "
-                f"with reliable provenance tracking. All parameters must be explicitly declared."
-            )
-
-    for p in sig.parameters.values():
-        if p.kind in (
+    has_kwargs = False
+    for p in inspect.signature(fn).parameters.values():
+        if p.kind is inspect.Parameter.VAR_KEYWORD:
+            has_kwargs = True
+        elif p.kind in (
             inspect.Parameter.KEYWORD_ONLY,
             inspect.Parameter.POSITIONAL_OR_KEYWORD,
         ):
             if p.name not in _RESERVED_NAMES:
                 names.add(p.name)
+    return names, has_kwargs
+
+
+def _is_allowed_dynamic(processor_cls) -> bool:
+    class_name = processor_cls.__name__
+    return any(pattern in class_name for pattern in _ALLOWED_KWARGS_PATTERNS)
+
+
+def _check_kwargs(processor_cls, has_kwargs: bool) -> None:
+    if has_kwargs and not _is_allowed_dynamic(processor_cls):
+        raise ValueError(
+            f"Processor {processor_cls.__name__} uses **kwargs which is incompatible "
+            f"with reliable provenance tracking. All parameters must be explicitly declared."
+        )
+
+
+def _allowed_param_names(processor_cls) -> Set[str]:
+    """Introspect `_process_logic` and return allowed parameter names.
+
+    Allowed names exclude framework-reserved names.
+    Processors with **kwargs are rejected for provenance reliability,
+    except for certain factory-generated classes that need dynamic parameters.
+    """
+
+    names, has_kwargs = _signature_parts(processor_cls)
+    _check_kwargs(processor_cls, has_kwargs)
     return names
 
 
@@ -98,33 +107,11 @@ def classify_unknown_config_params(
     no issues are reported as parameters are passed through dynamically.
     """
 
-    # Check if processor has **kwargs
-    fn = getattr(processor_cls, "_process_logic", None)
-    if fn is not None:
-        sig = inspect.signature(fn)
-        has_kwargs = any(
-            p.kind is inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
-        )
-
-        if has_kwargs:
-            # Check if this is an allowed **kwargs processor
-            class_name = processor_cls.__name__
-            allowed_kwargs_patterns = [
-                "ParametricSweep",  # Parametric sweep factory
-                "Rename_",  # ContextProcessor rename factory
-                "Delete_",  # ContextProcessor delete factory
-                "Template_",  # ContextProcessor template factory
-            ]
-
-            is_allowed_dynamic = any(
-                pattern in class_name for pattern in allowed_kwargs_patterns
-            )
-
-            if is_allowed_dynamic:
-                # For allowed dynamic processors, don't validate parameters
-                return []
-
-    allowed = _allowed_param_names(processor_cls)
+    allowed, has_kwargs = _signature_parts(processor_cls)
+    if has_kwargs and _is_allowed_dynamic(processor_cls):
+        # For allowed dynamic processors, don't validate parameters
+        return []
+    _check_kwargs(processor_cls, has_kwargs)
     extras = [k for k in processor_config.keys() if k not in allowed]
     issues: List[Dict[str, Any]] = []
     for name in extras:
@@ -157,7 +144,7 @@ def resolve_runtime_value(
     """Single source of truth for runtime resolution: config > context > default."""
     if name in processor_config:
         return processor_config[name]
-    if name in context.keys():
+    if _has_context_key(context, name):
         return context.get_value(name)
     d = _default_for(processor_cls, name)
     if d is not _NO_DEFAULT:
@@ -35,17 +35,48 @@ from __future__ import annotations
 
 import json
 import hashlib
+import sys
 import uuid
 from pathlib import Path
 from typing import Any, List
 
 import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from semantiva.pipeline.node_preprocess import preprocess_node_config
 from semantiva.registry import resolve_parameters
 from semantiva.registry.descriptors import descriptor_to_json
 
 # Namespace used for deterministic node UUID generation
-_NODE_NAMESPACE = uuid.UUID("00000000-0000-0000-0000-000000000000")
+_NODE_NAMESPACE = uuid.UUID(int=0)
+
+# Canonical JSON encoder (sorted keys, compact separators) shared by identity
+# computations; equivalent to json.dumps(..., sort_keys=True, separators=(",", ":"))
+# without constructing a new encoder per call.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+def _processor_ref(cls: type) -> str:
+    """Return the dotted ``module.qualname`` reference for a processor class.
+
+    The result is interned so repeated canonicalizations share one string.
+    """
+    return sys.intern(f"{cls.__module__}.{cls.__qualname__}")
+
+
+def _nodes_from_document(loaded: Any) -> List[dict[str, Any]]:
+    """Return the node list of a parsed pipeline document.
+
+    Supports a bare node list or a top-level {pipeline: {nodes: [...]}} mapping.
+    """
+    if isinstance(loaded, dict) and "pipeline" in loaded:
+        loaded = loaded["pipeline"].get("nodes", [])
+    assert isinstance(loaded, list)
+    return loaded
 
 
 def _load_spec(pipeline_or_spec: Any) -> List[dict[str, Any]]:
@@ -54,6 +85,7 @@ def _load_spec(pipeline_or_spec: Any) -> List[dict[str, Any]]:
     Accepts:
       - Pipeline-like object with ``pipeline_configuration``
       - List/Tuple of node dicts
+      - Parsed pipeline document mapping {pipeline: {nodes: [...]}}
       - YAML path or YAML content (string). Supports top-level {pipeline: {nodes: [...]}}.
 
     Raises:
@@ -63,17 +95,16 @@ def _load_spec(pipeline_or_spec: Any) -> List[dict[str, Any]]:
         return list(pipeline_or_spec.pipeline_configuration)
     if isinstance(pipeline_or_spec, (list, tuple)):
         return list(pipeline_or_spec)
+    if isinstance(pipeline_or_spec, dict) and "pipeline" in pipeline_or_spec:
+        return _nodes_from_document(pipeline_or_spec)
     if isinstance(pipeline_or_spec, str):
         path = Path(pipeline_or_spec)
         if path.exists():
-            with path.open("r", encoding="utf-8") as f:
-                loaded = yaml.safe_load(f)
+            with path.open("rb") as f:
+                loaded = yaml.load(f, Loader=_YamlLoader)
         else:
-            loaded = yaml.safe_load(pipeline_or_spec)
-        if isinstance(loaded, dict) and "pipeline" in loaded:
-            loaded = loaded["pipeline"].get("nodes", [])
-        assert isinstance(loaded, list)
-        return loaded
+            loaded = yaml.load(pipeline_or_spec, Loader=_YamlLoader)
+        return _nodes_from_document(loaded)
     raise TypeError(
         f"Unsupported pipeline specification type: {type(pipeline_or_spec)!r}"
     )
@@ -96,7 +127,7 @@ def _canonical_node(
     role = defn.get("role") or "processor"
     processor = defn.get("processor")
     if isinstance(processor, type):
-        processor = f"{processor.__module__}.{processor.__qualname__}"
+        processor = _processor_ref(processor)
     params = defn.get("parameters") or {}
     ports = defn.get("ports") or {}
     canon = {
@@ -121,7 +152,8 @@ def build_canonical_spec(
     graph with stable positional identities.
 
     Args:
-        pipeline_or_spec: YAML path, mapping, or Pipeline-like object.
+        pipeline_or_spec: YAML path or content, node list, parsed pipeline
+            mapping, or Pipeline-like object.
 
     Returns:
         tuple (canonical_spec, resolved_spec):
@@ -141,15 +173,15 @@ def build_canonical_spec(
         resolved.append(cfg)
         canon = _canonical_node(cfg, declaration_index, declaration_subindex)
         canon["params"] = descriptor_to_json(params)
-        node_json = json.dumps(canon, sort_keys=True, separators=(",", ":"))
+        node_json = _CANONICAL_ENCODER.encode(canon)
         node_uuid = str(uuid.uuid5(_NODE_NAMESPACE, node_json))
         canon_with_uuid = dict(canon)
         canon_with_uuid["node_uuid"] = node_uuid
         nodes.append(canon_with_uuid)
         node_uuids.append(node_uuid)
     edges = [
-        {"source": node_uuids[i], "target": node_uuids[i + 1]}
-        for i in range(len(node_uuids) - 1)
+        {"source": source, "target": target}
+        for source, target in zip(node_uuids, node_uuids[1:])
     ]
     return ({"version": 1, "nodes": nodes, "edges": edges}, resolved)
 
@@ -166,7 +198,7 @@ def compute_pipeline_id(canonical_spec: dict[str, Any]) -> str:
     Stable under cosmetic changes (whitespace, key order).
     Returns: "plid-" + sha256(canonical_spec JSON).
     """
-    spec_json = json.dumps(canonical_spec, sort_keys=True, separators=(",", ":"))
+    spec_json = _CANONICAL_ENCODER.encode(canonical_spec)
     return "plid-" + hashlib.sha256(spec_json.encode("utf-8")).hexdigest()
 
 
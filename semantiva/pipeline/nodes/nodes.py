@@ -34,6 +34,7 @@ from semantiva.context_processors.context_observer import (
 from semantiva.context_processors.context_types import (
     ContextType,
     ContextCollectionType,
+    _has_context_key,
 )
 from semantiva.data_types import NoDataType
 from semantiva.logger import Logger
@@ -332,7 +333,7 @@ class _PayloadSourceNode(_DataNode):
 
         # Merge context and loaded_context
         for key, value in loaded_context.items():
-            if key in context.keys():
+            if _has_context_key(context, key):
                 raise KeyError(f"Key '{key}' already exists in the context.")
             context.set_value(key, value)
         return Payload(loaded_data, context)
@@ -1044,7 +1045,7 @@ class _ContextDataProcessorNode(_PipelineNode):
         data = payload.data
         context = payload.context
 
-        if self.input_context_key not in context.keys():
+        if not _has_context_key(context, self.input_context_key):
             raise KeyError(self.input_context_key)
         context_value = context.get_value(self.input_context_key)
         processor = self.processor_cls(**self.processor_kwargs)
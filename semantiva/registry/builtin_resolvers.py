@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import functools
 import importlib
 import re
 from typing import Any, Optional, Type, cast
@@ -61,13 +62,21 @@ def _resolve_delete(value: str) -> Optional[Type]:
     return _context_deleter_factory(match.group("key"))
 
 
+@functools.lru_cache(maxsize=256)
+def _template_class(template: str, output_key: str) -> Type:
+    """Build one template processor class per ``(template, output_key)`` pair.
+
+    Template classes carry no mutable state, so repeated resolutions of the
+    same spec share the generated class instead of re-parsing the template.
+    """
+    return _context_template_factory(template=template, output_key=output_key)
+
+
 def _resolve_template(value: str) -> Optional[Type]:
     match = _RE_TEMPLATE.match(value)
     if not match:
         return None
-    return _context_template_factory(
-        template=match.group("template"), output_key=match.group("out")
-    )
+    return _template_class(match.group("template"), match.group("out"))
 
 
 def _resolve_slice(value: str) -> Optional[Type]:
@@ -0,0 +1,31 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""YAML loading helper for tests, preferring the libyaml C loader."""
+
+from __future__ import annotations
+
+from typing import IO, Any, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+def load_yaml(stream: Union[str, bytes, IO[str], IO[bytes]]) -> Any:
+    """Safe-load a YAML document, using ``CSafeLoader`` when available."""
+    return yaml.load(stream, Loader=_YamlLoader)
@@ -14,13 +14,27 @@
 
 """Test configuration and fixtures for Semantiva."""
 
+import copy
+import functools
+import json
+import os
+from importlib import resources
+from pathlib import Path
+from typing import Any, Callable, Dict, Union
+
 import pytest
 
 from semantiva.context_processors.context_types import ContextType
+from semantiva.eir import compile_eir_v1
+from semantiva.pipeline.graph_builder import build_canonical_spec, compute_pipeline_id
 from semantiva.examples.extension import SemantivaExamplesExtension
 from semantiva.examples.test_utils import FloatDataType
 from semantiva.registry.builtin_resolvers import reset_to_builtins
 from semantiva.registry.processor_registry import ProcessorRegistry
+from tests._yaml_util import load_yaml
+
+REPO_ROOT = Path(__file__).parents[1]
+LEDGER = REPO_ROOT / "docs" / "source" / "eir" / "eir_series_status.yaml"
 
 
 @pytest.fixture(autouse=True)
@@ -94,3 +108,74 @@ def float_data():
     """Provide a basic float data payload for operation tests."""
 
     return FloatDataType(2.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_eir_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    return compile_eir_v1(path)
+
+
+@pytest.fixture(scope="session")
+def compiled_eir() -> Callable[[Union[str, "os.PathLike[str]"]], Dict[str, Any]]:
+    """Compile a YAML spec to EIR once per session, keyed by path and mtime.
+
+    Each call returns a deep copy so tests may mutate the document freely.
+    """
+
+    def _compile(path: Union[str, "os.PathLike[str]"]) -> Dict[str, Any]:
+        p = Path(path)
+        eir = _compile_eir_cached(str(p), p.stat().st_mtime_ns)
+        return copy.deepcopy(eir)
+
+    return _compile
+
+
+@functools.lru_cache(maxsize=None)
+def _pipeline_id_cached(path: str, mtime_ns: int) -> str:
+    canonical, _ = build_canonical_spec(path)
+    return compute_pipeline_id(canonical)
+
+
+@pytest.fixture(scope="session")
+def pipeline_id_for() -> Callable[[Union[str, "os.PathLike[str]"]], str]:
+    """Canonicalize a YAML spec and return its pipeline_id once per session."""
+
+    def _pipeline_id(path: Union[str, "os.PathLike[str]"]) -> str:
+        p = Path(path)
+        return _pipeline_id_cached(str(p), p.stat().st_mtime_ns)
+
+    return _pipeline_id
+
+
+@pytest.fixture(scope="session")
+def ledger_doc() -> Dict[str, Any]:
+    """Parsed EIR series ledger, loaded once per test session."""
+    assert LEDGER.exists(), f"Missing SSOT ledger at {LEDGER}"
+    data = load_yaml(LEDGER.read_bytes())
+    assert isinstance(data, dict) and "eir_series" in data
+    return data
+
+
+@pytest.fixture(scope="session")
+def ledger_float_entries(ledger_doc: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Ledger float reference-suite entries indexed by ``id``."""
+    suite = ledger_doc["eir_series"]["reference_suite"]["float"]
+    assert isinstance(suite, list)
+    out: Dict[str, Dict[str, Any]] = {}
+    for entry in suite:
+        assert isinstance(entry, dict) and "id" in entry
+        out[str(entry["id"])] = entry
+    return out
+
+
+@pytest.fixture(scope="session")
+def ser_validator() -> Any:
+    """Draft 2020-12 validator for SER v1 records, compiled once per session."""
+    jsonschema = pytest.importorskip("jsonschema")
+    schema_path = (
+        resources.files("semantiva.trace.schema")
+        / "semantic_execution_record_v1.schema.json"
+    )
+    schema = json.loads(schema_path.read_bytes())
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
@@ -15,14 +15,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-
-import yaml
+from typing import Any, Dict
 
 from semantiva.eir import compile_eir_v1
 
 REPO_ROOT = Path(__file__).parents[2]
 SUITE = REPO_ROOT / "tests" / "eir_reference_suite"
-LEDGER = REPO_ROOT / "docs" / "source" / "eir" / "eir_series_status.yaml"
 
 REFS = [
     SUITE / "float_ref_01.yaml",
@@ -33,13 +31,13 @@ REFS = [
 ]
 
 
-def _expected() -> dict:
-    doc = yaml.safe_load(LEDGER.read_text(encoding="utf-8"))
-    return doc["eir_series"]["phase_2"]["eir_compiler_poc_forms_and_slots"]["checksums"]
+def _expected(ledger_doc: Dict[str, Any]) -> dict:
+    phase_2 = ledger_doc["eir_series"]["phase_2"]
+    return phase_2["eir_compiler_poc_forms_and_slots"]["checksums"]
 
 
-def test_compiled_identities_match_ledger() -> None:
-    exp = _expected()["compiled_identities"]
+def test_compiled_identities_match_ledger(ledger_doc: Dict[str, Any]) -> None:
+    exp = _expected(ledger_doc)["compiled_identities"]
     for ref in REFS:
         eir = compile_eir_v1(str(ref))
         ident = eir["identity"]
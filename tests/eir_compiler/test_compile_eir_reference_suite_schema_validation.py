@@ -21,8 +21,6 @@ from pathlib import Path
 import jsonschema
 import pytest
 
-from semantiva.eir import compile_eir_v1
-
 REPO_ROOT = Path(__file__).parents[2]
 SUITE = REPO_ROOT / "tests" / "eir_reference_suite"
 REFS = [
@@ -33,10 +31,13 @@ REFS = [
     SUITE / "float_ref_lane_01.yaml",
 ]
 
+_SCHEMA_PATH = resources.files("semantiva.eir.schema") / "eir_v1.schema.json"
+VALIDATOR = jsonschema.Draft202012Validator(json.loads(_SCHEMA_PATH.read_bytes()))
+
 
 @pytest.mark.parametrize("ref", REFS, ids=[p.stem for p in REFS])
-def test_compile_reference_suite_validates_against_schema(ref: Path) -> None:
-    eir = compile_eir_v1(str(ref))
-    schema_path = resources.files("semantiva.eir.schema") / "eir_v1.schema.json"
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    jsonschema.Draft202012Validator(schema).validate(eir)
+def test_compile_reference_suite_validates_against_schema(
+    ref: Path, compiled_eir
+) -> None:
+    eir = compiled_eir(ref)
+    VALIDATOR.validate(eir)
@@ -20,17 +20,13 @@ from pathlib import Path
 
 import jsonschema
 
-from semantiva.eir import compile_eir_v1
-
 REPO_ROOT = Path(__file__).parents[2]
 REF = REPO_ROOT / "tests" / "eir_reference_suite" / "float_ref_01.yaml"
 
+_SCHEMA_PATH = resources.files("semantiva.eir.schema") / "eir_v1.schema.json"
+VALIDATOR = jsonschema.Draft202012Validator(json.loads(_SCHEMA_PATH.read_bytes()))
 
-def test_compiled_eir_validates_against_schema() -> None:
-    eir = compile_eir_v1(str(REF))
-
-    schema_path = resources.files("semantiva.eir.schema") / "eir_v1.schema.json"
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
 
-    validator = jsonschema.Draft202012Validator(schema)
-    validator.validate(eir)
+def test_compiled_eir_validates_against_schema(compiled_eir) -> None:
+    eir = compiled_eir(REF)
+    VALIDATOR.validate(eir)
@@ -0,0 +1,61 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from semantiva.eir.compiler import _fingerprint_source
+from semantiva.examples.test_utils import FloatMultiplyOperation
+
+REPO_ROOT = Path(__file__).parents[2]
+REF = REPO_ROOT / "tests" / "eir_reference_suite" / "float_ref_01.yaml"
+
+
+def test_yaml_path_fingerprint_is_file_sha256() -> None:
+    kind, fp = _fingerprint_source(str(REF))
+    assert kind == "yaml_path"
+    assert fp == hashlib.sha256(REF.read_bytes()).hexdigest()
+    assert _fingerprint_source(str(REF)) == (kind, fp)
+
+
+def test_yaml_path_fingerprint_tracks_same_size_edits(tmp_path: Path) -> None:
+    spec = tmp_path / "spec.yaml"
+    spec.write_bytes(REF.read_bytes() + b"# one\n")
+    st = spec.stat()
+    _, before = _fingerprint_source(str(spec))
+
+    # Same size and same mtime: only the content changes.
+    spec.write_bytes(REF.read_bytes() + b"# two\n")
+    os.utime(spec, ns=(st.st_atime_ns, st.st_mtime_ns))
+    _, after = _fingerprint_source(str(spec))
+
+    assert after != before
+    assert after == hashlib.sha256(spec.read_bytes()).hexdigest()
+
+
+def test_node_list_fingerprint_normalizes_processor_classes() -> None:
+    dotted = (
+        f"{FloatMultiplyOperation.__module__}.{FloatMultiplyOperation.__qualname__}"
+    )
+    from_class = _fingerprint_source(
+        [{"processor": FloatMultiplyOperation, "parameters": {"factor": 2.0}}]
+    )
+    from_string = _fingerprint_source(
+        [{"processor": dotted, "parameters": {"factor": 2.0}}]
+    )
+    assert from_class[0] == "node_list"
+    assert from_class == from_string
@@ -16,25 +16,26 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from semantiva.eir import compile_eir_v1
 from semantiva.eir.compiler import compute_eir_id
 
 REPO_ROOT = Path(__file__).parents[2]
 REF = REPO_ROOT / "tests" / "eir_reference_suite" / "float_ref_01.yaml"
 
+_MUTATED_SEMANTICS = {
+    "payload_forms": {
+        "version": 1,
+        "root_form": "scalar",
+        "terminal_form": "scalar",
+        "node_io": {},
+    }
+}
+
 
-def test_eir_id_changes_when_semantics_changes() -> None:
-    eir = compile_eir_v1(str(REF))
+def test_eir_id_changes_when_semantics_changes(compiled_eir) -> None:
+    eir = compiled_eir(REF)
     base = eir["identity"]["eir_id"]
 
     mutated = dict(eir)
-    mutated["semantics"] = {
-        "payload_forms": {
-            "version": 1,
-            "root_form": "scalar",
-            "terminal_form": "scalar",
-            "node_io": {},
-        }
-    }
+    mutated["semantics"] = _MUTATED_SEMANTICS
 
     assert compute_eir_id(mutated) != base
@@ -41,3 +41,25 @@ def test_lane_merge_to_multichannel_uses_lane_keys_as_channels() -> None:
     assert isinstance(out, MultiChannelDataType)
     assert isinstance(out.get("a"), FloatDataType)
     assert isinstance(out.get("b"), FloatDataType)
+
+
+def test_lane_bundle_with_lane_checks_only_new_entry(monkeypatch) -> None:
+    first = FloatDataType(1.0)
+    lb = LaneBundleDataType({"a": first})
+    source = lb.data
+
+    def _fail(self, data):
+        raise AssertionError("existing lanes must not be revalidated")
+
+    monkeypatch.setattr(LaneBundleDataType, "validate", _fail)
+    updated = lb.with_lane("b", FloatDataType(2.0))
+
+    assert updated is not lb
+    assert set(updated.keys()) == {"a", "b"}
+    assert updated.get("a") is first
+    assert updated.data is not source
+    assert lb.data is source and set(source) == {"a"}
+    with pytest.raises(TypeError):
+        lb.with_lane("", FloatDataType(3.0))
+    with pytest.raises(TypeError):
+        lb.with_lane("c", 3.0)  # type: ignore[arg-type]
@@ -14,33 +14,24 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 from dataclasses import dataclass
-from importlib import resources
 from pathlib import Path
 from typing import Any, Dict, List
 
 import pytest
-import yaml
 
 from semantiva import Payload
 from semantiva.configurations import load_pipeline_from_yaml
 from semantiva.context_processors import ContextType
 from semantiva.data_types import NoDataType
 from semantiva.pipeline import Pipeline
-from semantiva.pipeline.graph_builder import build_canonical_spec, compute_pipeline_id
 from semantiva.examples.test_utils import FloatDataType
 from semantiva.trace.drivers.jsonl import JsonlTraceDriver
 
-try:
-    import jsonschema
-except Exception:  # pragma: no cover - optional dependency
-    jsonschema = None
-
-
 REPO_ROOT = Path(__file__).parents[2]
-LEDGER_PATH = REPO_ROOT / "docs" / "source" / "eir" / "eir_series_status.yaml"
 SUITE_DIR = REPO_ROOT / "tests" / "eir_reference_suite"
 
 
@@ -92,31 +83,20 @@ REF_CASES: List[RefCase] = [
 ]
 
 
-def _sha256_file(path: Path) -> str:
-    return hashlib.sha256(path.read_bytes()).hexdigest()
-
-
-def _load_ledger() -> Dict[str, Any]:
-    assert LEDGER_PATH.exists(), f"Missing SSOT ledger at {LEDGER_PATH}"
-    data = yaml.safe_load(LEDGER_PATH.read_text(encoding="utf-8"))
-    assert isinstance(data, dict) and "eir_series" in data
-    return data
+@functools.lru_cache(maxsize=None)
+def _sha256_cached(path: str, mtime_ns: int) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
 
 
-def _ledger_float_entries() -> Dict[str, Dict[str, Any]]:
-    data = _load_ledger()
-    suite = data["eir_series"]["reference_suite"]["float"]
-    assert isinstance(suite, list)
-    out: Dict[str, Dict[str, Any]] = {}
-    for entry in suite:
-        assert isinstance(entry, dict) and "id" in entry
-        out[str(entry["id"])] = entry
-    return out
+def _sha256_file(path: Path) -> str:
+    return _sha256_cached(str(path), path.stat().st_mtime_ns)
 
 
-def test_eir_series_ledger_contract_and_drift_detection() -> None:
+def test_eir_series_ledger_contract_and_drift_detection(
+    ledger_float_entries: Dict[str, Dict[str, Any]], pipeline_id_for
+) -> None:
     """Unit + golden: enforce ledger presence and detect reference drift."""
-    entries = _ledger_float_entries()
+    entries = ledger_float_entries
 
     for case in REF_CASES:
         assert case.ref_id in entries, f"Ledger missing entry for {case.ref_id}"
@@ -129,8 +109,7 @@ def test_eir_series_ledger_contract_and_drift_detection() -> None:
         assert e["yaml_sha256"] == _sha256_file(yaml_path)
 
         # Drift: canonical graph -> pipeline_id
-        canonical, _ = build_canonical_spec(str(yaml_path))
-        assert e["pipeline_id"] == compute_pipeline_id(canonical)
+        assert e["pipeline_id"] == pipeline_id_for(yaml_path)
 
 
 @pytest.mark.parametrize("case", REF_CASES, ids=[c.ref_id for c in REF_CASES])
@@ -154,12 +133,9 @@ def test_float_reference_suite_executes(case: RefCase) -> None:
 
 @pytest.mark.parametrize("case", REF_CASES, ids=[c.ref_id for c in REF_CASES])
 def test_float_reference_suite_emits_ser_schema_conformant(
-    tmp_path: Path, case: RefCase
+    tmp_path: Path, case: RefCase, ser_validator
 ) -> None:
     """Golden: ensure SER emission remains schema-valid for a reference pipeline."""
-    if jsonschema is None:  # pragma: no cover
-        pytest.skip("jsonschema not installed")
-
     cfg = load_pipeline_from_yaml(str(case.yaml_path))
 
     trace_path = tmp_path / "eir_ref.ser.jsonl"
@@ -170,14 +146,10 @@ def test_float_reference_suite_emits_ser_schema_conformant(
     pipeline.process(payload)
     tracer.close()
 
-    schema_path = (
-        resources.files("semantiva.trace.schema")
-        / "semantic_execution_record_v1.schema.json"
-    )
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    validator = jsonschema.Draft202012Validator(schema)
-
-    for line in trace_path.read_text(encoding="utf-8").splitlines():
-        rec = json.loads(line)
-        if rec.get("record_type") == "ser":
-            validator.validate(rec)
+    with trace_path.open("rb") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            if rec.get("record_type") == "ser":
+                ser_validator.validate(rec)
@@ -0,0 +1,61 @@
+# Copyright 2025 Semantiva authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared scalar reference table for the EIR runtime tests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Mapping, Tuple
+
+from semantiva.context_processors.context_types import ContextType
+from semantiva.data_types import NoDataType
+from semantiva.pipeline.payload import Payload
+
+REPO_ROOT = Path(__file__).parents[2]
+SUITE = REPO_ROOT / "tests" / "eir_reference_suite"
+
+
+@dataclass(frozen=True)
+class ScalarRef:
+    ref_id: str
+    initial_context: Mapping[str, Any]
+    expected_data_float: float
+    expected_context: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def yaml_path(self) -> Path:
+        return SUITE / f"{self.ref_id}.yaml"
+
+    def payload(self) -> Payload:
+        """Return a fresh payload seeded with a copy of the initial context."""
+        return Payload(NoDataType(), ContextType(dict(self.initial_context)))
+
+
+SCALAR_REFS: Tuple[ScalarRef, ...] = (
+    ScalarRef(
+        ref_id="float_ref_01",
+        initial_context={"value": 1.0, "addend": 2.0},
+        expected_data_float=3.0,
+        expected_context={"result": 3.0},
+    ),
+    ScalarRef(
+        ref_id="float_ref_02",
+        initial_context={"value": 2.0, "factor": 10.0, "addend": -1.0},
+        expected_data_float=19.0,
+    ),
+)
+SCALAR_REF_IDS = [r.ref_id for r in SCALAR_REFS]
+FLOAT_REF_01, FLOAT_REF_02 = SCALAR_REFS
@@ -2,23 +2,18 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
+import pytest
 
 from semantiva.configurations.load_pipeline_from_yaml import parse_pipeline_config
-from semantiva.context_processors.context_types import ContextType
-from semantiva.data_types import NoDataType
-from semantiva.eir.compiler import compile_eir_v1
 from semantiva.eir.execution_scalar import execute_eir_v1_scalar_plan
 from semantiva.pipeline.payload import Payload
 from semantiva.pipeline import Pipeline
-
-
-def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+from tests._yaml_util import load_yaml
+from tests.eir_runtime._refs import SCALAR_REF_IDS, SCALAR_REFS, ScalarRef
 
 
 def _run_legacy_from_yaml(spec_path: Path, payload: Payload) -> Payload:
-    raw = yaml.safe_load(spec_path.read_text(encoding="utf-8")) or {}
+    raw = load_yaml(spec_path.read_bytes()) or {}
     cfg = parse_pipeline_config(
         raw, source_path=str(spec_path), base_dir=spec_path.parent
     )
@@ -26,9 +21,8 @@ def _run_legacy_from_yaml(spec_path: Path, payload: Payload) -> Payload:
     return pipe.process(payload)
 
 
-def _run_eir_from_yaml(spec_path: Path, payload: Payload) -> Payload:
-    eir = compile_eir_v1(str(spec_path))
-    return execute_eir_v1_scalar_plan(eir, payload)
+def _run_eir_from_yaml(compiled_eir, spec_path: Path, payload: Payload) -> Payload:
+    return execute_eir_v1_scalar_plan(compiled_eir(spec_path), payload)
 
 
 def _assert_scalar_payload_parity(legacy_out: Payload, eir_out: Payload) -> None:
@@ -42,23 +36,9 @@ def _assert_scalar_payload_parity(legacy_out: Payload, eir_out: Payload) -> None
     assert legacy_out.context.to_dict() == eir_out.context.to_dict()
 
 
-def test_parity_float_ref_01_legacy_vs_eir() -> None:
-    spec = _repo_root() / "tests" / "eir_reference_suite" / "float_ref_01.yaml"
-    payload = Payload(NoDataType(), ContextType({"value": 1.0, "addend": 2.0}))
-
-    legacy_out = _run_legacy_from_yaml(spec, payload)
-    eir_out = _run_eir_from_yaml(spec, payload)
-
-    _assert_scalar_payload_parity(legacy_out, eir_out)
-
-
-def test_parity_float_ref_02_legacy_vs_eir() -> None:
-    spec = _repo_root() / "tests" / "eir_reference_suite" / "float_ref_02.yaml"
-    payload = Payload(
-        NoDataType(), ContextType({"value": 2.0, "factor": 10.0, "addend": -1.0})
-    )
-
-    legacy_out = _run_legacy_from_yaml(spec, payload)
-    eir_out = _run_eir_from_yaml(spec, payload)
+@pytest.mark.parametrize("ref", SCALAR_REFS, ids=SCALAR_REF_IDS)
+def test_parity_legacy_vs_eir(ref: ScalarRef, compiled_eir) -> None:
+    legacy_out = _run_legacy_from_yaml(ref.yaml_path, ref.payload())
+    eir_out = _run_eir_from_yaml(compiled_eir, ref.yaml_path, ref.payload())
 
     _assert_scalar_payload_parity(legacy_out, eir_out)
@@ -14,8 +14,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 
 from semantiva.context_processors.context_types import ContextType
@@ -24,16 +22,13 @@ from semantiva.execution.orchestrator.orchestrator import LocalSemantivaOrchestr
 from semantiva.execution.transport.in_memory import InMemorySemantivaTransport
 from semantiva.logger import Logger
 from semantiva.pipeline.payload import Payload
-
-
-def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+from tests.eir_runtime._refs import FLOAT_REF_01, FLOAT_REF_02
 
 
 def test_orchestrator_default_is_legacy() -> None:
     orch = LocalSemantivaOrchestrator()
-    spec = str(_repo_root() / "tests" / "eir_reference_suite" / "float_ref_01.yaml")
-    payload = Payload(NoDataType(), ContextType({"value": 1.0, "addend": 2.0}))
+    spec = str(FLOAT_REF_01.yaml_path)
+    payload = FLOAT_REF_01.payload()
 
     out = orch.execute(
         pipeline_spec=spec,
@@ -47,8 +42,8 @@ def test_orchestrator_default_is_legacy() -> None:
 
 def test_orchestrator_opt_in_eir_scalar_float_ref_01() -> None:
     orch = LocalSemantivaOrchestrator()
-    spec = str(_repo_root() / "tests" / "eir_reference_suite" / "float_ref_01.yaml")
-    payload = Payload(NoDataType(), ContextType({"value": 1.0, "addend": 2.0}))
+    spec = str(FLOAT_REF_01.yaml_path)
+    payload = FLOAT_REF_01.payload()
 
     out = orch.execute(
         pipeline_spec=spec,
@@ -64,10 +59,8 @@ def test_orchestrator_opt_in_eir_scalar_float_ref_01() -> None:
 
 def test_orchestrator_opt_in_eir_scalar_float_ref_02() -> None:
     orch = LocalSemantivaOrchestrator()
-    spec = str(_repo_root() / "tests" / "eir_reference_suite" / "float_ref_02.yaml")
-    payload = Payload(
-        NoDataType(), ContextType({"value": 2.0, "factor": 10.0, "addend": -1.0})
-    )
+    spec = str(FLOAT_REF_02.yaml_path)
+    payload = FLOAT_REF_02.payload()
 
     out = orch.execute(
         pipeline_spec=spec,
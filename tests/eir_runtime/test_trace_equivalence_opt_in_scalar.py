@@ -15,71 +15,46 @@
 from __future__ import annotations
 
 import json
-from importlib import resources
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List
 
-import pytest
-
-try:
-    import jsonschema
-except Exception:  # pragma: no cover - optional dependency
-    jsonschema = None
-    pytest.skip("jsonschema not installed", allow_module_level=True)
-
-from semantiva.context_processors.context_types import ContextType
-from semantiva.data_types import NoDataType
 from semantiva.execution.orchestrator.orchestrator import LocalSemantivaOrchestrator
 from semantiva.execution.transport.in_memory import InMemorySemantivaTransport
 from semantiva.logger import Logger
-from semantiva.pipeline.payload import Payload
 from semantiva.trace.drivers.jsonl import JsonlTraceDriver
+from tests.eir_runtime._refs import FLOAT_REF_01
 
 
-def _repo_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
+    with path.open("rb") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
 
 
-def _load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    return [
-        json.loads(line)
-        for line in path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+_DROP = frozenset(
+    {"timestamp", "created_at", "duration_ms", "run_id", "summaries", "timing"}
+)
+_IDENTITY_DROP = frozenset({"run_id"})
 
 
 def _normalize(rec: Dict[str, Any]) -> Dict[str, Any]:
-    rec = dict(rec)
-    for key in ("timestamp", "created_at", "duration_ms"):
-        rec.pop(key, None)
-    rec.pop("run_id", None)
-    if isinstance(rec.get("identity"), dict):
-        rec["identity"] = {k: v for k, v in rec["identity"].items() if k != "run_id"}
-    if "summaries" in rec:
-        rec.pop("summaries")
-    rec.pop("timing", None)
-    return rec
-
-
-def _validator() -> jsonschema.Draft202012Validator:  # type: ignore[name-defined]
-    schema_path = (
-        resources.files("semantiva.trace.schema")
-        / "semantic_execution_record_v1.schema.json"
-    )
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    return jsonschema.Draft202012Validator(schema)  # type: ignore[attr-defined]
+    out = {k: v for k, v in rec.items() if k not in _DROP}
+    ident = out.get("identity")
+    if isinstance(ident, dict):
+        out["identity"] = {k: v for k, v in ident.items() if k not in _IDENTITY_DROP}
+    return out
 
 
-def test_trace_equivalence_legacy_vs_eir_scalar_float_ref_01(tmp_path: Path) -> None:
-    spec = str(_repo_root() / "tests" / "eir_reference_suite" / "float_ref_01.yaml")
-    payload_legacy = Payload(NoDataType(), ContextType({"value": 1.0, "addend": 2.0}))
-    payload_eir = Payload(NoDataType(), ContextType({"value": 1.0, "addend": 2.0}))
+def test_trace_equivalence_legacy_vs_eir_scalar_float_ref_01(
+    tmp_path: Path, ser_validator
+) -> None:
+    spec = str(FLOAT_REF_01.yaml_path)
+    payload_legacy = FLOAT_REF_01.payload()
+    payload_eir = FLOAT_REF_01.payload()
 
     legacy_path = tmp_path / "legacy.jsonl"
     eir_path = tmp_path / "eir.jsonl"
 
-    validator = _validator()
-
     orch_legacy = LocalSemantivaOrchestrator()
     orch_eir = LocalSemantivaOrchestrator()
 
@@ -108,9 +83,9 @@ def test_trace_equivalence_legacy_vs_eir_scalar_float_ref_01(tmp_path: Path) ->
     legacy_raw = _load_jsonl(legacy_path)
     eir_raw = _load_jsonl(eir_path)
 
-    for rec in legacy_raw + eir_raw:
+    for rec in chain(legacy_raw, eir_raw):
         if rec.get("record_type") == "ser":
-            validator.validate(rec)
+            ser_validator.validate(rec)
 
     legacy = [_normalize(x) for x in legacy_raw]
     eir = [_normalize(x) for x in eir_raw]
@@ -18,18 +18,20 @@ import pytest
 
 import jsonschema
 
-from semantiva.eir import compile_eir_v1, validate_eir_v1
+from semantiva.eir import is_eir_v1_valid, validate_eir_v1
 
+REF = "tests/eir_reference_suite/float_ref_01.yaml"
 
-def test_validate_eir_v1_accepts_compiled_reference() -> None:
+
+def test_validate_eir_v1_accepts_compiled_reference(compiled_eir) -> None:
     """Integration: compiler output validates via the canonical helper."""
-    eir = compile_eir_v1("tests/eir_reference_suite/float_ref_01.yaml")
+    eir = compiled_eir(REF)
     validate_eir_v1(eir)  # should not raise
 
 
-def test_validate_eir_v1_rejects_missing_required_fields() -> None:
+def test_validate_eir_v1_rejects_missing_required_fields(compiled_eir) -> None:
     """Unit: helper surfaces schema errors."""
-    eir = compile_eir_v1("tests/eir_reference_suite/float_ref_01.yaml")
+    eir = compiled_eir(REF)
     bad = dict(eir)
     bad.pop("plan")  # required by schema
 
@@ -53,3 +55,13 @@ def test_validate_eir_v1_minimal_golden_fixture() -> None:
         },
     }
     validate_eir_v1(minimal)  # should not raise
+
+
+def test_is_eir_v1_valid_matches_validate(compiled_eir) -> None:
+    """Unit: boolean helper agrees with the raising helper."""
+    eir = compiled_eir(REF)
+    assert is_eir_v1_valid(eir)
+
+    bad = dict(eir)
+    bad.pop("plan")
+    assert not is_eir_v1_valid(bad)
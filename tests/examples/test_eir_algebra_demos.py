@@ -14,21 +14,29 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import runpy
 from pathlib import Path
+from typing import Any, Dict
 
 import pytest
 
-
 DEMO_DIR = Path(__file__).parents[2] / "examples" / "eir_algebra_demos"
 GOLDEN_PATH = Path(__file__).with_name("golden_eir_algebra_demos.json")
 
 
-def _run_demo(module_filename: str) -> dict:
-    # Execute the file, then call its run() function.
+@functools.lru_cache(maxsize=None)
+def _demo_scope(module_filename: str) -> Dict[str, Any]:
+    # Execute the file once per session and keep its globals.
     # This keeps demos import-free even though examples/ is not a Python package.
-    scope = runpy.run_path(str(DEMO_DIR / module_filename))
+    return runpy.run_path(str(DEMO_DIR / module_filename))
+
+
+@functools.lru_cache(maxsize=None)
+def _run_demo(module_filename: str) -> dict:
+    # Demos are pure, so each run() result is computed once and shared read-only.
+    scope = _demo_scope(module_filename)
     assert "run" in scope and callable(scope["run"])
     return scope["run"]()
 
@@ -39,7 +47,7 @@ def test_demo_folder_exists():
 
 # --- Unit tests (helpers are pure + deterministic) ---
 def test_demo_1_normalization_is_float_only():
-    scope = runpy.run_path(str(DEMO_DIR / "algebra_demos.py"))
+    scope = _demo_scope("algebra_demos.py")
     normalize = scope["normalize_uint8_like_to_float"]
     from semantiva.examples.test_utils import FloatDataType
 
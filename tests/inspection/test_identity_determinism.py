@@ -234,11 +234,11 @@ def test_run_space_spec_id_when_present():
 )
 def test_sweep_example_sanitization():
     """Test that the sweep example file produces sanitized output."""
-    import yaml
+    from tests._yaml_util import load_yaml
 
     yaml_path = Path("docs/source/examples/pipeline_sweep_parameters_first.yaml")
     with yaml_path.open("r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = load_yaml(f)
 
     payload = build_inspection_payload(config)
     payload_json = json.dumps(payload)
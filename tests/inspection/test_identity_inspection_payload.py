@@ -21,7 +21,7 @@ from pathlib import Path
 from typing import Any
 import warnings
 
-import yaml
+from tests._yaml_util import load_yaml
 
 from semantiva.inspection.builder import (
     build,
@@ -34,7 +34,7 @@ from semantiva.registry.processor_registry import ProcessorRegistry
 
 def _load_config_and_inspection(yaml_path: Path) -> tuple[Any, Any]:
     ProcessorRegistry.register_modules("semantiva.examples.test_utils")
-    config = yaml.safe_load(yaml_path.read_text())
+    config = load_yaml(yaml_path.read_text())
     nodes = config.get("pipeline", {}).get("nodes", [])
     inspection = build_pipeline_inspection(nodes)
     return config, inspection
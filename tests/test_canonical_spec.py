@@ -13,8 +13,11 @@
 # limitations under the License.
 
 import json
+from pathlib import Path
 
-from semantiva.pipeline.graph_builder import build_canonical_spec
+from tests._yaml_util import load_yaml
+
+from semantiva.pipeline.graph_builder import build_canonical_spec, compute_pipeline_id
 from semantiva.registry.descriptors import ModelDescriptor
 from semantiva.workflows import PolynomialFittingModel
 
@@ -24,6 +27,31 @@ def test_build_canonical_spec_serializable():
     json.dumps(canonical)
 
 
+def test_build_canonical_spec_accepts_parsed_document():
+    path = Path("tests/pipeline_model_fitting.yaml")
+    from_path, _ = build_canonical_spec(str(path))
+    from_doc, _ = build_canonical_spec(load_yaml(path.read_text("utf-8")))
+    assert from_doc == from_path
+
+
+def test_node_uuid_and_pipeline_id_are_pinned():
+    # Golden identities: any change to the node namespace or to the canonical
+    # node fields hashed into node_uuid must show up here.
+    spec = [
+        {
+            "processor": "semantiva.examples.test_utils.FloatMultiplyOperation",
+            "parameters": {"factor": 2.0},
+        }
+    ]
+    canonical, _ = build_canonical_spec(spec)
+    assert canonical["nodes"][0]["node_uuid"] == (
+        "1d5a49ba-e899-50f1-985b-14f915348a9f"
+    )
+    assert compute_pipeline_id(canonical) == (
+        "plid-8bab788342dbb47ea6fdecc600445afeba3c126ecaf3212fac5be9480a5c1173"
+    )
+
+
 def test_descriptor_instantiate_equivalence():
     class_path = (
         f"{PolynomialFittingModel.__module__}.{PolynomialFittingModel.__qualname__}"
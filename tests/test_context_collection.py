@@ -16,6 +16,7 @@ import pytest
 from semantiva.context_processors.context_types import (
     ContextType,
     ContextCollectionType,
+    _has_context_key,
 )
 
 
@@ -69,6 +70,32 @@ def test_overlapping_keys_raise_error():
         _ = collection.get_item(0)
 
 
+def test_collection_membership_follows_iteration():
+    item = ContextType({"item": 1})
+    collection = ContextCollectionType(global_context={"g": 0}, context_list=[item])
+    assert item in collection
+    assert ContextType({"item": 1}) in collection
+    assert "item" not in collection and "g" not in collection
+    assert [x in collection for x in collection] == [True]
+
+
+def test_has_context_key_applies_collection_rules():
+    assert _has_context_key(ContextType({"a": 1}), "a")
+    assert not _has_context_key(ContextType({"a": 1}), "b")
+    collection = ContextCollectionType(
+        global_context={"g": 0}, context_list=[ContextType({"item": 1})]
+    )
+    assert _has_context_key(collection, "g")
+    assert _has_context_key(collection, "item")
+    assert not _has_context_key(collection, "missing")
+
+    overlapping = ContextCollectionType(
+        global_context={"overlap": 0}, context_list=[ContextType({"overlap": 1})]
+    )
+    with pytest.raises(ValueError):
+        _has_context_key(overlapping, "overlap")
+
+
 def test_append_and_type_validation():
     ctx1 = ContextType({"a": 1})
     collection = ContextCollectionType(context_list=[ctx1])
@@ -51,6 +51,45 @@ def test_template_factory_contract_and_execution():
     assert context.get_value("filename") == "exp_mouse01_3.png"
 
 
+def test_template_spec_resolves_to_cached_class():
+    spec = 'template:"exp_{subject}_{run}.png":filename'
+    assert resolve_symbol(spec) is resolve_symbol(spec)
+    assert resolve_symbol(spec) is not resolve_symbol(
+        'template:"exp_{subject}_{run}.png":other'
+    )
+
+
+def test_template_cache_holds_only_resolved_templates():
+    from semantiva.registry.builtin_resolvers import (
+        _resolve_template,
+        _template_class,
+    )
+
+    before = _template_class.cache_info().currsize
+    assert _resolve_template("FloatMultiplyOperation") is None
+    assert _resolve_template("rename:a:b") is None
+    with pytest.raises(ValueError):
+        _resolve_template('template:"exp_static.png":filename')
+    assert _template_class.cache_info().currsize == before
+
+
+def test_template_renders_repeated_and_escaped_placeholders():
+    cls = resolve_symbol('template:"{{raw}}_{a}_{b}_{a}":out')
+    assert cls.get_processing_parameter_names() == ["a", "b"]
+    processor = cls()
+    context = ContextType()
+    observer = _ValidatingContextObserver(
+        context_keys=cls.get_created_keys(),
+        suppressed_keys=cls.get_suppressed_keys(),
+        logger=None,
+    )
+    observer.observer_context = context
+    processor._set_context_observer(observer)
+    processor._process_logic(a=1, b="x")
+
+    assert context.get_value("out") == "{raw}_1_x_1"
+
+
 def test_template_missing_key_raises_keyerror():
     cls = resolve_symbol('template:"exp_{s}_{r}.png":filename')
     processor = cls()
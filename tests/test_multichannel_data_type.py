@@ -56,3 +56,26 @@ def test_multichannel_with_channel_returns_new_instance():
     assert mcdt is not updated
     assert set(updated.keys()) == {"a", "b"}
     assert updated.get("a") is first
+
+
+def test_multichannel_with_channel_checks_only_new_entry(monkeypatch):
+    mcdt = MultiChannelDataType({"a": DummyData(1)})
+
+    def _fail(self, data):
+        raise AssertionError("existing channels must not be revalidated")
+
+    monkeypatch.setattr(MultiChannelDataType, "validate", _fail)
+    updated = mcdt.with_channel("b", DummyData(2))
+    assert set(updated.keys()) == {"a", "b"}
+    assert set(mcdt.keys()) == {"a"}
+    with pytest.raises(TypeError):
+        mcdt.with_channel("c", 3)  # type: ignore[arg-type]
+
+
+def test_from_validated_runs_base_init_and_restores_validate():
+    updated = MultiChannelDataType({"a": DummyData(1)}).with_channel("b", DummyData(2))
+
+    assert updated.logger is not None
+    assert "validate" not in vars(updated)
+    with pytest.raises(TypeError):
+        updated.validate(123)  # type: ignore[arg-type]
@@ -25,11 +25,15 @@ This ensures the core, single-process orchestrator behaves as expected
 before plugging in more advanced transports or executors.
 """
 
+import enum
+import json
+
 import pytest
 
 from semantiva.execution.orchestrator.orchestrator import (
     LocalSemantivaOrchestrator,
     SemantivaOrchestrator,
+    _clone_json,
 )
 from semantiva import Pipeline, Payload
 from semantiva.execution.transport import InMemorySemantivaTransport
@@ -234,3 +238,44 @@ def test_remote_stub_inherits_template(fake_pipeline):
     assert remote_ser.context_delta == local_ser.context_delta
     assert remote_ser.processor == local_ser.processor
     assert len(stub.published) == len(fake_pipeline.resolved_spec)
+
+
+class _Level(enum.IntEnum):
+    HIGH = 2
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"a": [1, 2.5, (3, "x")], "b": {"c": None, "d": True}},
+        {1: "int", 2.5: "float", True: "bool", None: "none"},
+        {"level": _Level.HIGH, "nested": [{"t": ("a", "b")}]},
+    ],
+)
+def test_clone_json_matches_json_round_trip(value):
+    clone = _clone_json(value)
+    expected = json.loads(json.dumps(value))
+    assert clone == expected
+    assert json.dumps(clone, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+
+def test_clone_json_is_a_deep_copy():
+    source = {"a": {"b": [1, 2]}}
+    clone = _clone_json(source)
+    clone["a"]["b"].append(3)
+    assert source == {"a": {"b": [1, 2]}}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"sample": object()},
+        {"head": [1, {2, 3}]},
+        {("tuple", "key"): 1},
+    ],
+)
+def test_clone_json_rejects_non_json_like_json_dumps(value):
+    with pytest.raises(TypeError):
+        json.dumps(value)
+    with pytest.raises(TypeError):
+        _clone_json(value)
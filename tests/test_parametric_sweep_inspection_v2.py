@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import yaml
+from tests._yaml_util import load_yaml
 
 from semantiva.inspection import (
     build_pipeline_inspection,
@@ -44,7 +44,7 @@ def _build_inspection():
     from semantiva.examples.extension import SemantivaExamplesExtension
 
     SemantivaExamplesExtension().register()
-    cfg = yaml.safe_load(_SWEEP_PIPELINE_YAML)
+    cfg = load_yaml(_SWEEP_PIPELINE_YAML)
     return build_pipeline_inspection(cfg["pipeline"]["nodes"])
 
 
@@ -15,7 +15,7 @@
 from pathlib import Path
 
 import pytest
-import yaml
+from tests._yaml_util import load_yaml
 
 from semantiva.data_types.data_types import NoDataType
 from semantiva.pipeline.payload import Payload
@@ -23,7 +23,7 @@ from semantiva.pipeline.pipeline import Pipeline
 
 
 def _load_pipeline_from(path: Path) -> Pipeline:
-    cfg = yaml.safe_load(path.read_text())
+    cfg = load_yaml(path.read_text())
     return Pipeline(cfg["pipeline"]["nodes"])
 
 
@@ -66,7 +66,7 @@ pipeline:
     p = tmp_path / "bad.yaml"
     p.write_text(bad)
     with pytest.raises(ValueError):
-        Pipeline(yaml.safe_load(p.read_text())["pipeline"]["nodes"])
+        Pipeline(load_yaml(p.read_text())["pipeline"]["nodes"])
 
     bad2 = """
 pipeline:
@@ -82,4 +82,4 @@ pipeline:
     p2 = tmp_path / "bad2.yaml"
     p2.write_text(bad2)
     with pytest.raises(ValueError):
-        Pipeline(yaml.safe_load(p2.read_text())["pipeline"]["nodes"])
+        Pipeline(load_yaml(p2.read_text())["pipeline"]["nodes"])
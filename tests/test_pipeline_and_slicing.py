@@ -28,7 +28,7 @@ from semantiva.examples.test_utils import (
     FloatValueDataSourceWithDefault,
     FloatMockDataSink,
 )
-import yaml
+from tests._yaml_util import load_yaml
 from .test_string_extension import HelloOperation
 
 
@@ -248,7 +248,7 @@ pipeline:
 
     from semantiva.configurations.load_pipeline_from_yaml import parse_pipeline_config
 
-    full_config = yaml.safe_load(yaml_config)
+    full_config = load_yaml(yaml_config)
     pipeline_config = parse_pipeline_config(full_config)
 
     pipeline = Pipeline(pipeline_config.nodes)
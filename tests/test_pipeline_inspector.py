@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import yaml
+from tests._yaml_util import load_yaml
 from semantiva import Pipeline, Payload
 from semantiva.inspection import build_pipeline_inspection
 from semantiva.context_processors import ContextType
@@ -32,7 +32,7 @@ pipeline:
 
     from semantiva.configurations.load_pipeline_from_yaml import parse_pipeline_config
 
-    full_config = yaml.safe_load(yaml_config)
+    full_config = load_yaml(yaml_config)
     pipeline_config = parse_pipeline_config(full_config)
 
     pipeline = Pipeline(pipeline_config.nodes)
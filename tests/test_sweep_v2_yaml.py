@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 
-import yaml
+from tests._yaml_util import load_yaml
 
 from semantiva.pipeline import Pipeline, Payload
 from semantiva.context_processors.context_types import ContextType
@@ -51,7 +51,7 @@ class TestRegistrySetup:
                   collection: FloatDataCollection
         """
 
-        node_configs = yaml.safe_load(yaml_config)["pipeline"]["nodes"]
+        node_configs = load_yaml(yaml_config)["pipeline"]["nodes"]
         pipeline = Pipeline(node_configs)
 
         payload = pipeline.process(Payload(NoDataType(), ContextType()))
@@ -79,7 +79,7 @@ class TestRegistrySetup:
                   collection: FloatDataCollection
         """
 
-        node_configs = yaml.safe_load(yaml_config)["pipeline"]["nodes"]
+        node_configs = load_yaml(yaml_config)["pipeline"]["nodes"]
         pipeline = Pipeline(node_configs)
 
         payload = pipeline.process(Payload(NoDataType(), ContextType()))
@@ -107,7 +107,7 @@ class TestRegistrySetup:
                 factor: 5.0
         """
 
-        node_configs = yaml.safe_load(yaml_config)["pipeline"]["nodes"]
+        node_configs = load_yaml(yaml_config)["pipeline"]["nodes"]
         pipeline = Pipeline(node_configs)
 
         payload = pipeline.process(Payload(NoDataType(), ContextType()))
@@ -131,7 +131,7 @@ class TestRegistrySetup:
               context_key: "probe_values"
         """
 
-        node_configs = yaml.safe_load(yaml_config)["pipeline"]["nodes"]
+        node_configs = load_yaml(yaml_config)["pipeline"]["nodes"]
         pipeline = Pipeline(node_configs)
 
         payload = pipeline.process(Payload(NoDataType(), ContextType()))
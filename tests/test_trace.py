@@ -128,6 +128,23 @@ def test_jsonl_driver_creates_files(tmp_path: Path) -> None:
     assert any(rec.get("record_type") == "ser" for rec in content)
 
 
+def test_jsonl_driver_writes_records_in_order(tmp_path: Path) -> None:
+    trace_path = tmp_path / "batched.ser.jsonl"
+    tracer = JsonlTraceDriver(str(trace_path))
+    tracer.on_pipeline_start("pid", "rid", {"nodes": []}, {})
+    for i in range(150):
+        tracer.on_run_space_end(
+            "rid", run_space_launch_id="launch", run_space_attempt=i
+        )
+    tracer.on_pipeline_end("rid", {"status": "ok"})
+    tracer.flush()
+    records = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    assert [r["seq"] for r in records] == list(range(1, 153))
+    assert records[0]["record_type"] == "pipeline_start"
+    assert records[-1]["record_type"] == "pipeline_end"
+    tracer.close()
+
+
 def test_context_to_kv_repr() -> None:
     assert context_to_kv_repr({"b": 2, "a": 1}) == "a=1, b=2"
     big = {str(i): i for i in range(60)}
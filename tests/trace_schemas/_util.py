@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 from pathlib import Path
 from typing import Mapping
@@ -34,10 +35,16 @@ def schema(relpath: str) -> dict:
     return load_json(relpath)
 
 
+@functools.lru_cache(maxsize=None)
+def _schema_contents(path: Path) -> dict:
+    """Parse a schema file once per session; the result must not be mutated."""
+    return json.loads(path.read_bytes())
+
+
 def _build_registry() -> Registry:
     registry = Registry()
     for path in SCHEMA_DIR.glob("*.schema.json"):
-        contents = json.loads(path.read_text(encoding="utf-8"))
+        contents = _schema_contents(path)
         uri = contents.get("$id")
         if not isinstance(uri, str):
             continue
@@ -49,8 +56,11 @@ def _build_registry() -> Registry:
 _REGISTRY = _build_registry()
 
 
+@functools.lru_cache(maxsize=None)
 def validator(relpath: str) -> jsonschema.validators.Draft202012Validator:
-    contents = load_json(relpath)
+    contents = _schema_contents(ROOT / relpath)
+    # Cached, so each schema is checked against the metaschema once per session.
+    jsonschema.validators.Draft202012Validator.check_schema(contents)
     return jsonschema.validators.Draft202012Validator(contents, registry=_REGISTRY)
 
 